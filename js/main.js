@@ -69,6 +69,28 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 });
 
+// 各平台的类别选项（值, 显示名称），模块加载时构建一次
+const PLATFORM_CATEGORIES = {
+    amazon: [
+        'electronics', '电子产品',
+        'home', '家居用品',
+        'clothing', '服装',
+        'beauty', '美妆',
+        'toys', '玩具',
+        'other', '其他'
+    ],
+    temu: [
+        'apparel', '服装',
+        'home_garden', '家居花园',
+        'beauty', '美妆',
+        'electronics', '电子产品',
+        'jewelry', '珠宝首饰',
+        'toys_games', '玩具游戏',
+        'sports', '体育户外',
+        'other', '其他'
+    ]
+};
+
 /**
  * 根据选择的平台更新表单UI
  * @param {string} platform - 平台名称（amazon/temu）
@@ -82,40 +104,12 @@ function updateFormForPlatform(platform) {
     }
     
     // 根据平台添加不同的类别选项
-    if (platform === 'amazon') {
-        const amazonCategories = [
-            'electronics', '电子产品',
-            'home', '家居用品',
-            'clothing', '服装',
-            'beauty', '美妆',
-            'toys', '玩具',
-            'other', '其他'
-        ];
-        
-        for (let i = 0; i < amazonCategories.length; i += 2) {
-            const option = document.createElement('option');
-            option.value = amazonCategories[i];
-            option.textContent = amazonCategories[i + 1];
-            categorySelect.appendChild(option);
-        }
-    } else if (platform === 'temu') {
-        const temuCategories = [
-            'apparel', '服装',
-            'home_garden', '家居花园',
-            'beauty', '美妆',
-            'electronics', '电子产品',
-            'jewelry', '珠宝首饰',
-            'toys_games', '玩具游戏',
-            'sports', '体育户外',
-            'other', '其他'
-        ];
-        
-        for (let i = 0; i < temuCategories.length; i += 2) {
-            const option = document.createElement('option');
-            option.value = temuCategories[i];
-            option.textContent = temuCategories[i + 1];
-            categorySelect.appendChild(option);
-        }
+    const categories = PLATFORM_CATEGORIES[platform] || [];
+    for (let i = 0; i < categories.length; i += 2) {
+        const option = document.createElement('option');
+        option.value = categories[i];
+        option.textContent = categories[i + 1];
+        categorySelect.appendChild(option);
     }
     
     // 更新表单标题和占位符
@@ -160,35 +154,42 @@ function simulateDataCollection(url, category, keywords, riskFilters, platform)
     }, 200);
 }
 
+// 产品信息样本数据
+const SAMPLE_PRODUCT_DATA = {
+    amazon: {
+        title: "便携式蓝牙音箱，防水，20小时播放时间",
+        price: "$39.99",
+        rating: "4.5 / 5.0",
+        reviews: "1,245",
+        sales: "约500/月",
+        image: "https://via.placeholder.com/150?text=Amazon+Speaker",
+        riskLevel: "低"
+    },
+    temu: {
+        title: "无线蓝牙音箱便携式户外音响",
+        price: "$15.99",
+        rating: "4.3 / 5.0",
+        reviews: "368",
+        sales: "约1,200/月",
+        image: "https://via.placeholder.com/150?text=Temu+Speaker",
+        riskLevel: "中"
+    }
+};
+
+// 风险等级到样式类的映射
+const RISK_LEVEL_CLASSES = {
+    '低': 'low',
+    '中': 'medium',
+    '高': 'high'
+};
+
 /**
  * 显示样本数据
  * @param {string} platform - 平台名称
  */
 function displaySampleData(platform) {
-    // 产品信息样本数据
-    const sampleData = {
-        amazon: {
-            title: "便携式蓝牙音箱，防水，20小时播放时间",
-            price: "$39.99",
-            rating: "4.5 / 5.0",
-            reviews: "1,245",
-            sales: "约500/月",
-            image: "https://via.placeholder.com/150?text=Amazon+Speaker",
-            riskLevel: "低"
-        },
-        temu: {
-            title: "无线蓝牙音箱便携式户外音响",
-            price: "$15.99",
-            rating: "4.3 / 5.0",
-            reviews: "368",
-            sales: "约1,200/月",
-            image: "https://via.placeholder.com/150?text=Temu+Speaker",
-            riskLevel: "中"
-        }
-    };
-    
     // 获取当前平台的样本数据
-    const data = sampleData[platform];
+    const data = SAMPLE_PRODUCT_DATA[platform];
     
     // 更新UI元素
     document.getElementById('product-title').textContent = data.title;
@@ -207,9 +208,7 @@ function displaySampleData(platform) {
     // 设置风险等级
     const riskLevel = document.getElementById('risk-level');
     riskLevel.textContent = data.riskLevel;
-    riskLevel.className = 'risk-badge risk-' + 
-        (data.riskLevel === '低' ? 'low' : 
-        (data.riskLevel === '中' ? 'medium' : 'high'));
+    riskLevel.className = 'risk-badge risk-' + (RISK_LEVEL_CLASSES[data.riskLevel] || 'high');
 }
 
 /**
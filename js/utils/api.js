@@ -3,6 +3,13 @@
  * 负责处理与后端API的通信
  */
 
+const API_BASE_URL = 'https://api.example.com/temu-amazon/'; // 替换为实际API地址
+
+// 公共请求头（所有请求共用，只读）
+const DEFAULT_HEADERS = Object.freeze({
+    'Content-Type': 'application/json'
+});
+
 /**
  * 发送API请求
  * @param {string} endpoint - API端点
@@ -11,14 +18,10 @@
  * @returns {Promise} - Promise对象
  */
 async function fetchAPI(endpoint, data = {}, method = 'POST') {
-    const API_BASE_URL = 'https://api.example.com/temu-amazon/'; // 替换为实际API地址
-    
     try {
         const options = {
             method,
-            headers: {
-                'Content-Type': 'application/json'
-            }
+            headers: DEFAULT_HEADERS
         };
         
         // 如果是GET请求，将参数添加到URL中